@@ -7,7 +7,6 @@ import logging
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import requests
-from bs4 import BeautifulSoup
 import json
 import re
 
@@ -20,6 +19,9 @@ logger = logging.getLogger(__name__)
 SCORING_INDEPENDENT = {'QB', 'K', 'DST'}  # No scoring variants
 SCORING_DEPENDENT = {'RB', 'WR', 'TE', 'FLEX', 'ALL'}  # Have scoring variants
 
+# Embedded rankings JSON; the literal prefix lets the regex engine skip straight to candidates
+ECR_DATA_PATTERN = re.compile(r'var ecrData = ({.*?});', re.DOTALL)
+
 class FantasyProsScraper:
     """Simple, clean FantasyPros scraper"""
     
@@ -72,14 +74,10 @@ class FantasyProsScraper:
     def extract_data(self, html: str) -> Optional[Dict[str, Any]]:
         """Extract embedded JSON data"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            for script in soup.find_all('script'):
-                if script.string and 'var ecrData = ' in script.string:
-                    # Extract ecrData
-                    match = re.search(r'var ecrData = ({.*?});', script.string, re.DOTALL)
-                    if match:
-                        return json.loads(match.group(1))
+            # One search over the raw HTML - no DOM needed to find the script
+            match = ECR_DATA_PATTERN.search(html)
+            if match:
+                return json.loads(match.group(1))
             
             return None
             
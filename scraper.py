@@ -2,13 +2,27 @@
 FantasyPros Scraper
 """
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import ThreadPoolExecutor
 import json
 import csv
+import logging
 import os
 import re
 from enum import Enum
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Union
+
+try:
+    import orjson  # Much faster parse/serialize of the large ranking payloads
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache  # On-disk response cache so repeat runs skip the network
+except ImportError:
+    requests_cache = None
 
 class Position(Enum):
     QB = "qb"
@@ -25,77 +39,154 @@ class Scoring(Enum):
     HALF_PPR = "half"
     PPR = "ppr"
 
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.fantasypros.com"
+
 # Position groups: scoring format independent vs dependent
 SCORING_FORMAT_INDEPENDENT = {Position.QB, Position.K, Position.DST}  # Rankings don't change by scoring format
 SCORING_FORMAT_DEPENDENT = {Position.RB, Position.WR, Position.TE, Position.FLEX}  # Rankings change by scoring format
 
-class FantasyProsScraper:
+# JavaScript variables holding the page's embedded JSON data
+_MARKERS = {
+    'ecrData': re.compile(rb'var ecrData\s*=\s*'),
+    'adpData': re.compile(rb'var adpData\s*=\s*'),
+    'expertGroupsData': re.compile(rb'var expertGroupsData\s*=\s*'),
+    'playerProps': re.compile(rb'var playerProps\s*=\s*'),
+}
+
+# Output column -> ecrData player field, in CSV column order
+_PLAYER_FIELDS = {
+    'rank': 'rank_ecr',
+    'player_name': 'player_name',
+    'team': 'player_team_id',
+    'position': 'player_position_id',
+    'bye_week': 'player_bye_week',
+    'rank_min': 'rank_min',
+    'rank_max': 'rank_max',
+    'rank_avg': 'rank_ave',
+    'rank_std': 'rank_std',
+    'player_id': 'player_id',
+}
+
+# A whole JSON string literal (escapes included) or a single bracket
+_JSON_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+
+def _extract_json_literal(text: bytes, marker: re.Pattern) -> Optional[bytes]:
+    """
+    Return the JSON object/array literal assigned right after marker, or None.
+    Scans forward once counting bracket depth and skipping over string literals,
+    so the work is linear in the size of the literal with no regex backtracking.
+    """
+    match = marker.search(text)
+    if not match or text[match.end():match.end() + 1] not in (b'{', b'['):
+        return None
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.base_url = "https://www.fantasypros.com"
+    start = match.end()
+    depth = 0
+    for token in _JSON_TOKEN.finditer(text, start):
+        bracket = token.group()
+        if bracket in (b'{', b'['):
+            depth += 1
+        elif bracket in (b'}', b']'):
+            depth -= 1
+            if depth == 0:
+                return text[start:token.end()]
+    return None
+
+# Standard headers to look like a real browser
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': ACCEPT_ENCODING,  # Adds br (and zstd) when their decoders are installed
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+_SHARED_SESSION: Optional[requests.Session] = None
+
+def _shared_session() -> requests.Session:
+    """Session shared by every scraper instance so pooled connections (and the cache) are reused"""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        # Ranking pages change at most every few minutes, so cache responses for 5
+        if requests_cache:
+            _SHARED_SESSION = requests_cache.CachedSession('fp_cache', expire_after=300)
+        else:
+            _SHARED_SESSION = requests.Session()
+        _SHARED_SESSION.headers.update(_DEFAULT_HEADERS)
         
-        # Standard headers to look like a real browser
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        # Enough pooled connections for concurrent fetches from main()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        _SHARED_SESSION.mount("https://", adapter)
+        _SHARED_SESSION.mount("http://", adapter)
+    return _SHARED_SESSION
+
+class FantasyProsScraper:
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        # A caller-supplied session keeps its own headers
+        self.session = session or _shared_session()
+        self.base_url = BASE_URL
         
     def _build_url(self, position: Position, week: int, scoring: Scoring) -> str:
         """Build the correct FantasyPros URL based on position, week, and scoring"""
+        return self._cached_url(self.base_url, position, week, scoring)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_url(base_url: str, position: Position, week: int, scoring: Scoring) -> str:
+        """URL lookup behind _build_url, memoized per base URL"""
         
         if week == 0:  # Draft rankings
             if position == Position.ALL:
                 # Overall draft rankings
                 if scoring == Scoring.STANDARD:
-                    return f"{self.base_url}/nfl/rankings/consensus-cheatsheets.php"
+                    return f"{base_url}/nfl/rankings/consensus-cheatsheets.php"
                 elif scoring == Scoring.HALF_PPR:
-                    return f"{self.base_url}/nfl/rankings/half-point-ppr-cheatsheets.php"
+                    return f"{base_url}/nfl/rankings/half-point-ppr-cheatsheets.php"
                 elif scoring == Scoring.PPR:
-                    return f"{self.base_url}/nfl/rankings/ppr-cheatsheets.php"
+                    return f"{base_url}/nfl/rankings/ppr-cheatsheets.php"
             
             elif position in SCORING_FORMAT_INDEPENDENT:
                 # QB, K, DST draft rankings (no scoring variants)
-                return f"{self.base_url}/nfl/rankings/{position.value}-cheatsheets.php"
+                return f"{base_url}/nfl/rankings/{position.value}-cheatsheets.php"
             
             elif position in SCORING_FORMAT_DEPENDENT:
                 # RB, WR, TE, FLEX draft rankings with scoring
                 if scoring == Scoring.STANDARD:
-                    return f"{self.base_url}/nfl/rankings/{position.value}-cheatsheets.php"
+                    return f"{base_url}/nfl/rankings/{position.value}-cheatsheets.php"
                 elif scoring == Scoring.HALF_PPR:
-                    return f"{self.base_url}/nfl/rankings/half-point-ppr-{position.value}-cheatsheets.php"
+                    return f"{base_url}/nfl/rankings/half-point-ppr-{position.value}-cheatsheets.php"
                 elif scoring == Scoring.PPR:
-                    return f"{self.base_url}/nfl/rankings/ppr-{position.value}-cheatsheets.php"
+                    return f"{base_url}/nfl/rankings/ppr-{position.value}-cheatsheets.php"
         
         else:  # Weekly rankings
             if position in SCORING_FORMAT_INDEPENDENT:
                 # QB, K, DST weekly rankings (no scoring variants)
-                return f"{self.base_url}/nfl/rankings/{position.value}.php?week={week}"
+                return f"{base_url}/nfl/rankings/{position.value}.php?week={week}"
             
             elif position in SCORING_FORMAT_DEPENDENT:
                 # RB, WR, TE, FLEX weekly rankings with scoring
                 if scoring == Scoring.STANDARD:
-                    return f"{self.base_url}/nfl/rankings/{position.value}.php?week={week}"
+                    return f"{base_url}/nfl/rankings/{position.value}.php?week={week}"
                 elif scoring == Scoring.HALF_PPR:
-                    return f"{self.base_url}/nfl/rankings/half-point-ppr-{position.value}.php?week={week}"
+                    return f"{base_url}/nfl/rankings/half-point-ppr-{position.value}.php?week={week}"
                 elif scoring == Scoring.PPR:
-                    return f"{self.base_url}/nfl/rankings/ppr-{position.value}.php?week={week}"
+                    return f"{base_url}/nfl/rankings/ppr-{position.value}.php?week={week}"
             
             elif position == Position.ALL:
                 # Overall weekly rankings
                 if scoring == Scoring.STANDARD:
-                    return f"{self.base_url}/nfl/rankings/consensus.php?week={week}"
+                    return f"{base_url}/nfl/rankings/consensus.php?week={week}"
                 elif scoring == Scoring.HALF_PPR:
-                    return f"{self.base_url}/nfl/rankings/half-point-ppr-consensus.php?week={week}"
+                    return f"{base_url}/nfl/rankings/half-point-ppr-consensus.php?week={week}"
                 elif scoring == Scoring.PPR:
-                    return f"{self.base_url}/nfl/rankings/ppr-consensus.php?week={week}"
+                    return f"{base_url}/nfl/rankings/ppr-consensus.php?week={week}"
         
         # Fallback
-        return f"{self.base_url}/nfl/rankings/{position.value}.php?week={week}"
+        return f"{base_url}/nfl/rankings/{position.value}.php?week={week}"
         
     def get_rankings(self, position: Position, week: int = 0, scoring: Scoring = Scoring.STANDARD) -> Optional[Dict[str, Any]]:
         """
@@ -108,27 +199,29 @@ class FantasyProsScraper:
         """
         try:
             url = self._build_url(position, week, scoring)
-            print(f"🌐 Fetching: {url}")
+            logger.debug(f"🌐 Fetching: {url}")
             
             response = self.session.get(url)
             
             if response.status_code == 200:
-                print("✅ Successfully retrieved page")
-                return self.extract_embedded_data(response.text)
+                logger.debug("✅ Successfully retrieved page")
+                return self.extract_embedded_data(response.content)
             else:
-                print(f"❌ Failed to get page: {response.status_code}")
+                logger.warning(f"❌ Failed to get page: {response.status_code}")
                 return None
                 
         except Exception as e:
-            print(f"❌ Error getting rankings: {e}")
+            logger.error(f"❌ Error getting rankings: {e}")
             return None
     
-    def extract_embedded_data(self, html_content: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON data embedded in JavaScript variables"""
+    def extract_embedded_data(self, html_content: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Extract JSON data embedded in JavaScript variables.
+        Works on the raw response bytes; the JSON slices go straight to the parser undecoded.
+        """
+        if isinstance(html_content, str):  # Decoded HTML from older callers
+            html_content = html_content.encode()
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            scripts = soup.find_all('script')
-            
             extracted_data = {
                 'ecrData': None,
                 'adpData': None, 
@@ -136,75 +229,50 @@ class FantasyProsScraper:
                 'playerProps': None
             }
             
-            for script in scripts:
-                if script.string:
-                    script_content = script.string
-                    
-                    # Extract various data types
-                    patterns = {
-                        'ecrData': r'var ecrData = ({.*?});',
-                        'adpData': r'var adpData = (\[.*?\]);',
-                        'expertGroupsData': r'var expertGroupsData = ({.*?});',
-                        'playerProps': r'var playerProps = (\[.*?\]);'
-                    }
-                    
-                    for data_type, pattern in patterns.items():
-                        match = re.search(pattern, script_content, re.DOTALL)
-                        if match:
-                            try:
-                                extracted_data[data_type] = json.loads(match.group(1))
-                                print(f"✅ Found {data_type}")
-                            except json.JSONDecodeError:
-                                print(f"⚠️ Found {data_type} but couldn't parse JSON")
+            # Search the raw HTML directly - no need to build a DOM just to find <script> text
+            for data_type, marker in _MARKERS.items():
+                literal = _extract_json_literal(html_content, marker)
+                if literal:
+                    try:
+                        extracted_data[data_type] = orjson.loads(literal) if orjson else json.loads(literal)
+                        logger.debug(f"✅ Found {data_type}")
+                    except json.JSONDecodeError:
+                        logger.warning(f"⚠️ Found {data_type} but couldn't parse JSON")
             
             return extracted_data
             
         except Exception as e:
-            print(f"❌ Error extracting embedded data: {e}")
+            logger.error(f"❌ Error extracting embedded data: {e}")
             return None
     
     def process_rankings(self, extracted_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process the extracted data into a clean format"""
         try:
             if not extracted_data or not extracted_data.get('ecrData'):
-                print("❌ No ranking data found")
+                logger.warning("❌ No ranking data found")
                 return None
             
             ecr_data = extracted_data['ecrData']
             adp_data = extracted_data.get('adpData', [])
             
             # Create ADP lookup for faster access
-            adp_lookup = {}
-            if adp_data:
-                for item in adp_data:
-                    if 'player_id' in item and 'rank_ecr' in item:
-                        adp_lookup[item['player_id']] = item['rank_ecr']
+            adp_lookup = {
+                item['player_id']: item['rank_ecr']
+                for item in adp_data or []
+                if 'player_id' in item and 'rank_ecr' in item
+            }
             
-            players = []
+            players = [
+                {out: player.get(src, '') for out, src in _PLAYER_FIELDS.items()}
+                for player in ecr_data.get('players', [])
+            ]
             
-            # Check if ecrData has players array
-            if 'players' in ecr_data:
-                for player in ecr_data['players']:
-                    processed_player = {
-                        'rank': player.get('rank_ecr', ''),
-                        'player_name': player.get('player_name', ''),
-                        'team': player.get('player_team_id', ''),
-                        'position': player.get('player_position_id', ''),
-                        'bye_week': player.get('player_bye_week', ''),
-                        'rank_min': player.get('rank_min', ''),
-                        'rank_max': player.get('rank_max', ''),
-                        'rank_avg': player.get('rank_ave', ''),
-                        'rank_std': player.get('rank_std', ''),
-                        'player_id': player.get('player_id', ''),
-                    }
-                    
-                    # Add ADP data if available
-                    if processed_player['player_id'] and processed_player['player_id'] in adp_lookup:
-                        processed_player['adp_rank'] = adp_lookup[processed_player['player_id']]
-                    
-                    players.append(processed_player)
+            # Add ADP data if available
+            for player in players:
+                if player['player_id'] and player['player_id'] in adp_lookup:
+                    player['adp_rank'] = adp_lookup[player['player_id']]
             
-            print(f"✅ Processed {len(players)} players")
+            logger.debug(f"✅ Processed {len(players)} players")
             
             return {
                 'players': players,
@@ -220,7 +288,7 @@ class FantasyProsScraper:
             }
             
         except Exception as e:
-            print(f"❌ Error processing rankings: {e}")
+            logger.error(f"❌ Error processing rankings: {e}")
             return None
     
     def save_data(self, data: Dict[str, Any], output_dir: str = "output", 
@@ -241,28 +309,33 @@ class FantasyProsScraper:
             
             # Save JSON
             json_file = f"{output_dir}/{filename_base}.json"
-            with open(json_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            print(f"💾 Saved JSON: {json_file}")
+            if orjson:
+                with open(json_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(json_file, 'w') as f:
+                    json.dump(data, f, indent=2)
+            logger.info(f"💾 Saved JSON: {json_file}")
             
             # Save CSV
             csv_file = f"{output_dir}/{filename_base}.csv"
             if data['players']:
                 with open(csv_file, 'w', newline='') as f:
-                    fieldnames = data['players'][0].keys()
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(data['players'])
-                print(f"💾 Saved CSV: {csv_file}")
+                    fieldnames = list(data['players'][0].keys())
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows([p.get(k, '') for k in fieldnames] for p in data['players'])
+                logger.info(f"💾 Saved CSV: {csv_file}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Error saving data: {e}")
+            logger.error(f"❌ Error saving data: {e}")
             return False
 
 def main():
     """Test the updated scraper"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     scraper = FantasyProsScraper()
     
     print("🏈 FantasyPros Scraper - Clean URLs & Data Pipeline")
@@ -276,13 +349,14 @@ def main():
         {"position": Position.ALL, "week": 0, "scoring": Scoring.HALF_PPR},
     ]
     
-    for test_case in test_cases:
+    # Fetch every page concurrently - each request is network-bound and independent
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda test_case: scraper.get_rankings(**test_case), test_cases))
+    
+    for test_case, extracted_data in zip(test_cases, results):
         print(f"\n📊 Testing: {test_case['position'].value.upper()} - Week {test_case['week']} - {test_case['scoring'].value.upper()}")
         print("-" * 40)
         
-        # Get raw data
-        extracted_data = scraper.get_rankings(**test_case)
-        
         if extracted_data:
             # Process into clean format
             processed_data = scraper.process_rankings(extracted_data)
@@ -7,22 +7,48 @@ Provides insights and visualizations from the data
 import pandas as pd
 from pathlib import Path
 import argparse
+from functools import lru_cache
 from typing import List, Optional
 import json
 
+# Non-expert columns of a rankings table
+META = frozenset({'Player ID', 'Player', 'Average Rank', 'Std Dev', 'Expert Count'})
+
+
+def get_expert_columns(df: pd.DataFrame) -> pd.Index:
+    """Expert rank columns of a rankings table, in file order"""
+    return df.columns.difference(META, sort=False)
+
+
+@lru_cache(maxsize=16)
+def _read_rankings(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a rankings file; mtime and size are part of the cache key so edits invalidate it"""
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, engine='pyarrow')  # Multi-threaded C++ parser
+    
+    # Ranks fit comfortably in float32 - half the memory of the float64 pandas defaults to
+    expert_cols = get_expert_columns(df)
+    return df.astype({col: 'float32' for col in expert_cols})
+
 
 def load_latest_rankings(output_dir: Path = Path("output")) -> Optional[pd.DataFrame]:
-    """Load the most recent rankings file"""
-    csv_files = list(output_dir.glob("expert_rankings_*.csv"))
-    if not csv_files:
+    """Load the most recent rankings file, preferring its Parquet copy over the CSV"""
+    ranking_files = list(output_dir.glob("expert_rankings_*.parquet")) + list(output_dir.glob("expert_rankings_*.csv"))
+    if not ranking_files:
         print("No ranking files found in output directory")
         return None
     
     # Get the most recent file
-    latest_file = max(csv_files, key=lambda x: x.stat().st_mtime)
+    latest_file = max(ranking_files, key=lambda x: x.stat().st_mtime)
+    if latest_file.with_suffix('.parquet').exists():
+        latest_file = latest_file.with_suffix('.parquet')
     print(f"Loading rankings from: {latest_file.name}")
     
-    return pd.read_csv(latest_file)
+    # Copy so callers can modify the frame without touching the cached one
+    stat = latest_file.stat()
+    return _read_rankings(str(latest_file), stat.st_mtime_ns, stat.st_size).copy()
 
 
 def show_top_consensus_players(df: pd.DataFrame, n: int = 20):
@@ -57,23 +83,16 @@ def show_expert_statistics(df: pd.DataFrame):
     print("=" * 80)
     
     # Get expert columns
-    expert_cols = [col for col in df.columns if col not in 
-                   ['Player ID', 'Player', 'Average Rank', 'Std Dev', 'Expert Count']]
+    expert_cols = get_expert_columns(df)
     
     print(f"Total experts analyzed: {len(expert_cols)}")
     
-    # Show how many players each expert ranked
-    expert_stats = []
-    for expert in expert_cols:
-        ranked_count = df[expert].notna().sum()
-        avg_rank = df[expert].mean()
-        expert_stats.append({
-            'Expert': expert,
-            'Players Ranked': ranked_count,
-            'Average Rank Given': avg_rank
-        })
-    
-    expert_df = pd.DataFrame(expert_stats).sort_values('Players Ranked', ascending=False)
+    # Show how many players each expert ranked (one reduction over all expert columns)
+    expert_df = pd.DataFrame({
+        'Expert': expert_cols,
+        'Players Ranked': df[expert_cols].notna().sum().values,
+        'Average Rank Given': df[expert_cols].mean().values
+    }).sort_values('Players Ranked', ascending=False)
     
     print("\nExperts by number of players ranked:")
     for idx, row in expert_df.head(10).iterrows():
@@ -81,14 +100,15 @@ def show_expert_statistics(df: pd.DataFrame):
 
 
 def find_outlier_rankings(df: pd.DataFrame, player_name: str):
-    """Find which experts are outliers for a specific player"""
-    player_row = df[df['Player'] == player_name]
-    
-    if player_row.empty:
+    """Find which experts are outliers for a specific player (df is indexed by Player)"""
+    try:
+        player_row = df.loc[player_name]
+    except KeyError:
         print(f"\nPlayer '{player_name}' not found")
         return
     
-    player_row = player_row.iloc[0]
+    if isinstance(player_row, pd.DataFrame):  # Several players share the name
+        player_row = player_row.iloc[0]
     avg_rank = player_row['Average Rank']
     std_dev = player_row['Std Dev']
     
@@ -97,22 +117,17 @@ def find_outlier_rankings(df: pd.DataFrame, player_name: str):
     print("=" * 80)
     
     # Get expert columns
-    expert_cols = [col for col in df.columns if col not in 
-                   ['Player ID', 'Player', 'Average Rank', 'Std Dev', 'Expert Count']]
-    
-    rankings = []
-    for expert in expert_cols:
-        rank = player_row[expert]
-        if pd.notna(rank):
-            deviation = rank - avg_rank
-            rankings.append({
-                'Expert': expert,
-                'Rank': int(rank),
-                'Deviation': deviation
-            })
+    expert_cols = get_expert_columns(df)
+    
+    ranks = player_row[expert_cols].dropna().astype(float)
+    rankings_df = pd.DataFrame({
+        'Expert': ranks.index,
+        'Rank': ranks.values.astype(int),
+        'Deviation': (ranks - avg_rank).values
+    })
     
     # Sort by deviation
-    rankings_df = pd.DataFrame(rankings).sort_values('Deviation')
+    rankings_df = rankings_df.sort_values('Deviation')
     
     # Show highest and lowest rankings
     print("\nHighest rankings (most optimistic):")
@@ -159,6 +174,9 @@ def main():
     if df is None:
         return
     
+    # Index by name so player lookups don't scan the whole column
+    df = df.set_index('Player', drop=False)
+    
     print(f"\n📊 Loaded {len(df)} players from {df['Expert Count'].iloc[0]} experts")
     
     # Run analyses
@@ -4,20 +4,29 @@ FantasyPros Expert Rankings Scraper
 Uses strategic pairing to deduce individual expert rankings from consensus data
 """
 
+import argparse
 import asyncio
+import hashlib
 import json
 import os
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 
 import pandas as pd
-from playwright.async_api import Page, async_playwright, expect
+import pyarrow as pa
+import pyarrow.parquet as pq
+from playwright.async_api import Browser, BrowserContext, Page, Request, Route, async_playwright, expect
 from dotenv import load_dotenv
 import colorlog
 import numpy as np
 
+from scraper_kernels import deduce_from_baseline, deduce_triplet
+
 # Load environment variables
 load_dotenv()
 
@@ -43,6 +52,132 @@ if os.getenv('DEBUG', 'false').lower() == 'true':
 else:
     logger.setLevel('DEBUG')  # Temporarily force DEBUG level for troubleshooting
 
+# Requests the scraper never reads, dropped when BLOCK_ASSETS is enabled
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_HOSTS = ("doubleclick", "google-analytics", "googletagmanager", "adservice",
+                 "amazon-adsystem", "scorecardresearch", "facebook.net")
+
+# "Name (Site)" for every row of the experts modal, null for rows without a name
+EXPERT_NAMES_JS = """m => Array.from(m.querySelectorAll('.experts-modal-table__expert')).map(row => {
+    const name = row.querySelector('.yearbook-block__title-link')?.innerText?.trim();
+    const site = row.querySelector('.yearbook-block__description-text')?.innerText?.trim();
+    return name ? (site ? `${name} (${site})` : name) : null;
+})"""
+
+# Check exactly the named experts' rows (unchecking all others), returning the names left checked
+SELECT_EXPERTS_JS = """(m, names) => {
+    const checked = [];
+    m.querySelectorAll('.experts-modal-table__expert').forEach(row => {
+        const name = row.querySelector('.yearbook-block__title-link')?.innerText?.trim();
+        const site = row.querySelector('.yearbook-block__description-text')?.innerText?.trim();
+        const full = name ? (site ? `${name} (${site})` : name) : null;
+        const checkbox = row.querySelector("input[type='checkbox']");
+        if (!checkbox) return;
+        if (checkbox.checked !== names.includes(full)) checkbox.click();
+        if (checkbox.checked) checked.push(full);
+    });
+    return checked;
+}"""
+
+# Text of the rankings table body; a change after Apply shows the new pair's table has rendered
+RANKING_TABLE_TEXT_JS = "document.querySelector('#ranking-table tbody')?.innerText ?? ''"
+
+# Apply/save buttons in the experts modal, tried in order
+APPLY_BUTTON_SELECTORS = [
+    "button.fp-cta-button.fp-cta-button__primary:has-text('Apply')",
+    "button:has-text('Apply')",
+    "button.fp-cta-button:has-text('Apply')",
+]
+
+# How long a saved login session is reused before logging in again
+AUTH_STATE_MAX_AGE = timedelta(days=7)
+
+# Chromium features the scraper never uses; skipping them cuts startup and per-page CPU
+CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-extensions",
+    "--disable-features=Translate,MediaRouter",
+]
+
+# Service workers would answer requests before our routes see them
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 900},
+    "service_workers": "block",
+    "reduced_motion": "reduce",
+}
+
+
+class NetworkCache:
+    """On-disk cache of document/XHR responses, replayed through Playwright request routing"""
+    
+    CACHEABLE_TYPES = {"document", "xhr", "fetch"}
+    # Anything else (e.g. Apply / Save My Experts) changes server state and must reach the site
+    CACHEABLE_METHODS = {"GET", "HEAD"}
+    BYPASS_URL_PARTS = ("signin", "login", "logout", "accounts")
+    # Only cookies naming the login session key entries; analytics/consent cookies churn per view
+    SESSION_COOKIE_PARTS = ("session", "auth", "login", "token")
+    
+    def __init__(self, cache_dir: Path, ttl_minutes: int = 60,
+                 vary: Optional[Callable[[Request], str]] = None):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_minutes * 60
+        self.vary = vary
+        self.bypass_pages: Set[Page] = set()  # Pages that must see the live site (e.g. the login probe)
+        self.hits = 0
+        self.misses = 0
+    
+    def _session_cookies(self, cookie: str) -> str:
+        """The session/auth part of a Cookie header, in a stable order"""
+        pairs = (part.strip() for part in cookie.split(";"))
+        return ";".join(sorted(
+            pair for pair in pairs
+            if any(part in pair.split("=", 1)[0].lower() for part in self.SESSION_COOKIE_PARTS)
+        ))
+    
+    def _entry_dir(self, request: Request, cookie: str) -> Path:
+        """Cache entry location keyed by method, URL, the session cookies and the vary key"""
+        key = hashlib.sha1(f"{request.method} {request.url}".encode())
+        # Logged-out and logged-in (or differently logged-in) requests never share an entry
+        key.update(hashlib.sha1(self._session_cookies(cookie).encode()).digest())
+        if self.vary:
+            key.update(self.vary(request).encode())
+        host = urlparse(request.url).hostname or "unknown"
+        return self.cache_dir / host / key.hexdigest()
+    
+    async def handler(self, route: Route) -> None:
+        """Serve a fresh cached response if available, otherwise fetch and store it"""
+        request = route.request
+        if (request.frame.page in self.bypass_pages or request.resource_type not in self.CACHEABLE_TYPES
+                or request.method not in self.CACHEABLE_METHODS
+                or any(part in request.url for part in self.BYPASS_URL_PARTS)):
+            await route.fallback()
+            return
+        
+        entry = self._entry_dir(request, await request.header_value("cookie") or "")
+        headers_file, body_file = entry / "headers.json", entry / "body.bin"
+        
+        if body_file.exists() and time.time() - body_file.stat().st_mtime < self.ttl_seconds:
+            meta = json.loads(headers_file.read_text())
+            self.hits += 1
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body_file.read_bytes())
+            return
+        
+        response = await route.fetch()
+        body = await response.body()
+        if response.ok:
+            entry.mkdir(parents=True, exist_ok=True)
+            # Never replay cookies: a hit must not overwrite the live session/CSRF cookies
+            headers = {name: value for name, value in response.headers.items()
+                       if name.lower() != "set-cookie"}
+            headers_file.write_text(json.dumps({"status": response.status, "headers": headers}))
+            body_file.write_bytes(body)
+        self.misses += 1
+        await route.fulfill(response=response, body=body)
+
 
 class FantasyProsScraper:
     """Main scraper class for FantasyPros expert rankings"""
@@ -51,28 +186,160 @@ class FantasyProsScraper:
         """Initialize scraper with configuration from environment"""
         self.email = os.getenv('FANTASYPROS_EMAIL')
         self.password = os.getenv('FANTASYPROS_PASSWORD')
-        self.headless = os.getenv('HEADLESS', 'false').lower() == 'true'
+        # Headful by default for local debugging, headless on CI unless overridden
+        self.headless = os.getenv('HEADLESS', 'true' if os.getenv('CI') else 'false').lower() == 'true'
         self.timeout = int(os.getenv('TIMEOUT', '60000'))
         self.delay = int(os.getenv('DELAY_BETWEEN_REQUESTS', '2000'))
         self.output_dir = Path(os.getenv('OUTPUT_DIR', 'output'))
         self.save_screenshots = os.getenv('SAVE_SCREENSHOTS', 'false').lower() == 'true'
+        self.block_assets = os.getenv('BLOCK_ASSETS', 'false').lower() == 'true'
+        self.write_csv = os.getenv('WRITE_CSV', 'true').lower() == 'true'
+        self.write_xlsx = os.getenv('WRITE_XLSX', 'false').lower() == 'true'
+        self.top_n = int(os.getenv('TOP_N', '0'))  # 0 = keep every player in the output
+        # Share of a pair's players that must be deducible before trying another baseline
+        self.min_baseline_coverage = float(os.getenv('BASELINE_MIN_COVERAGE', '0.5'))
+        # Additional baselines each target is paired with, for the least-squares refinement
+        self.extra_baseline_pairs = int(os.getenv('EXTRA_BASELINE_PAIRS', '0'))
         self.max_experts = int(os.getenv('MAX_EXPERTS_TO_SCRAPE', '50'))
+        self.network_cache_ttl = int(os.getenv('NETWORK_CACHE_TTL_MINUTES', '60'))
+        self.concurrent_contexts = max(1, int(os.getenv('CONCURRENT_CONTEXTS', '4')))
+        
+        # Adaptive post-selection delay: halves on fast clean responses, doubles on throttling
+        self._delay_ms = max(250, self.delay // 4)
+        self._max_delay = self.delay * 4
+        self._throttled_pages: Set[Page] = set()
+        # Pages whose table was not seen to change after the last Apply; the delay must not shrink
+        self._unrefreshed_pages: Set[Page] = set()
         
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
         if self.save_screenshots:
             (self.output_dir / 'screenshots').mkdir(exist_ok=True)
         
+        # Per-pair consensus checkpoints so an interrupted run can resume
+        self.pair_cache_dir = self.output_dir / 'pair_cache'
+        self.pair_cache_dir.mkdir(exist_ok=True)
+        # Rankings move during the week, so older checkpoints are re-scraped (0 = never expire)
+        self.pair_cache_max_age = float(os.getenv('PAIR_CACHE_MAX_AGE_HOURS', '12')) * 3600
+        
         # Data storage
         self.player_map: Dict[str, str] = {}
-        self.expert_rankings: Dict[str, Dict[str, float]] = {}
+        self._pid_index: Dict[str, int] = {}  # player_id -> position in ranking vectors
+        self.expert_rankings: Dict[str, np.ndarray] = {}
         self.experts_list: List[str] = []
+        self._baselines: List[Tuple[str, np.ndarray]] = []
+        self._pair_observations: List[Tuple[str, str, np.ndarray]] = []
+        
+        # Expert pair currently applied on each page (keys the network cache)
+        self._page_selection: Dict[Page, Tuple[str, str]] = {}
+        self._page_locators: Dict[Page, SimpleNamespace] = {}
+        # "Save My Experts" stores the selection on the shared account, so it is only safe
+        # while a single context is scraping; workers hand over once it is needed
+        self._active_contexts = 1
+        self._single_context_required = False
+        self.network_cache: Optional[NetworkCache] = None
+        if self.network_cache_ttl > 0:
+            self.network_cache = NetworkCache(self.output_dir / '.net_cache', self.network_cache_ttl,
+                                              vary=self._selection_key)
         
         # URLs
         self.base_url = "https://www.fantasypros.com"
         self.login_url = f"{self.base_url}/accounts/signin/"
         self.post_login_url = f"{self.base_url}/?signedin"
         self.rankings_url = f"{self.base_url}/nfl/rankings/half-point-ppr-cheatsheets.php"
+        
+        # Saved cookies/localStorage from the last successful login
+        self.auth_state_path = self.output_dir / '.auth.json'
+    
+    def _selection_key(self, request: Request) -> str:
+        """Expert pair applied on the page that issued the request"""
+        try:
+            selection = self._page_selection.get(request.frame.page, ())
+        except Exception:
+            selection = ()
+        return "|".join(sorted(selection))
+    
+    def _locators(self, page: Page) -> SimpleNamespace:
+        """Locators for the rankings page and experts modal, built once per page"""
+        if page not in self._page_locators:
+            modal = page.locator(".experts-modal")
+            self._page_locators[page] = SimpleNamespace(
+                open_modal_button=page.locator("button[aria-label='Open experts modal']"),
+                modal=modal,
+                close_button=page.locator("button.experts-modal__header-close"),
+                select_all=page.locator("#experts-modal-select-all"),
+                apply_buttons=[(selector, page.locator(selector)) for selector in APPLY_BUTTON_SELECTORS],
+                save_button=modal.get_by_role("button", name="Save My Experts"),
+                first_tier_row=page.locator("#ranking-table tbody tr[data-tier='1']"),
+            )
+        return self._page_locators[page]
+    
+    def _watch_responses(self, page: Page) -> None:
+        """Flag the page as throttled whenever the server answers 429 or 5xx"""
+        def on_response(response) -> None:
+            if response.status == 429 or response.status >= 500:
+                self._throttled_pages.add(page)
+        page.on("response", on_response)
+    
+    def _adjust_delay(self, success: bool) -> None:
+        """Halve the delay after a fast clean scrape, double it after throttling or failure"""
+        if success:
+            self._delay_ms = max(100, self._delay_ms // 2)
+        else:
+            self._delay_ms = min(self._max_delay, self._delay_ms * 2)
+        logger.debug(f"Delay between requests now {self._delay_ms}ms")
+    
+    async def _block_assets(self, route: Route) -> None:
+        """Abort images, fonts, stylesheets and ad/analytics requests"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.fallback()
+    
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a browser context with the saved session, network cache and asset blocking installed"""
+        if self._auth_state_valid():
+            context = await browser.new_context(storage_state=str(self.auth_state_path), **CONTEXT_OPTIONS)
+        else:
+            context = await browser.new_context(**CONTEXT_OPTIONS)
+        if self.network_cache:
+            await context.route("**/*", self.network_cache.handler)
+        # Registered last so it runs first and blocked requests never reach the cache
+        if self.block_assets:
+            await context.route("**/*", self._block_assets)
+        return context
+    
+    def _auth_state_valid(self) -> bool:
+        """Whether a saved login session exists and is recent enough to reuse"""
+        if not self.auth_state_path.exists():
+            return False
+        age = datetime.now() - datetime.fromtimestamp(self.auth_state_path.stat().st_mtime)
+        return age < AUTH_STATE_MAX_AGE
+    
+    async def _ensure_logged_in(self, page: Page) -> bool:
+        """Reuse the saved login session when it is still accepted, otherwise log in"""
+        if self._auth_state_valid():
+            # A cached page would show the old logged-in HTML whether or not the session still works
+            if self.network_cache:
+                self.network_cache.bypass_pages.add(page)
+            try:
+                await page.goto(self.rankings_url, wait_until="domcontentloaded", timeout=self.timeout)
+                try:
+                    await page.wait_for_selector("#ranking-table tbody tr.player-row", timeout=self.timeout)
+                except Exception as e:
+                    logger.warning(f"Rankings table did not appear: {e}")
+                logged_out = await page.locator("a:has-text('Login'), a:has-text('Sign In')").count() > 0
+            finally:
+                if self.network_cache:
+                    self.network_cache.bypass_pages.discard(page)
+            
+            if not logged_out:
+                logger.info("Reusing saved login session")
+                return True
+            logger.info("Saved login session is no longer valid, logging in again")
+        
+        return await self.login(page)
     
     def validate_config(self) -> bool:
         """Validate required configuration"""
@@ -96,7 +363,7 @@ class FantasyProsScraper:
             
             # Go directly to the signin page
             await page.goto(self.login_url, wait_until="domcontentloaded", timeout=self.timeout)
-            await page.wait_for_timeout(2000)  # Let page fully load
+            await page.wait_for_selector("input[type='password'], form", timeout=self.timeout)
             
             logger.info("Filling login credentials...")
             
@@ -234,7 +501,16 @@ class FantasyProsScraper:
             logger.info(f"Post-login URL: {current_url}")
             logger.info(f"Navigating to rankings page: {self.rankings_url}")
             await page.goto(self.rankings_url, wait_until="domcontentloaded", timeout=self.timeout)
-            await page.wait_for_timeout(2000)  # Allow page to fully load
+            
+            # Wait only for the rankings table the scraper actually reads
+            try:
+                await page.wait_for_selector("#ranking-table tbody tr.player-row", timeout=self.timeout)
+            except Exception as e:
+                logger.warning(f"Rankings table did not appear: {e}")
+            
+            # Persist the session so later runs and worker contexts can skip the login form
+            await page.context.storage_state(path=self.auth_state_path)
+            os.chmod(self.auth_state_path, 0o600)  # Holds live session cookies
             
             logger.info("Login successful!")
             return True
@@ -246,39 +522,21 @@ class FantasyProsScraper:
     async def get_available_experts(self, page: Page) -> List[str]:
         """Get list of all available experts from the modal"""
         logger.info("Fetching available experts...")
+        locators = self._locators(page)
         
         # Open expert selection modal
-        await page.locator("button[aria-label='Open experts modal']").click()
+        await locators.open_modal_button.click()
         
-        experts_modal = page.locator(".experts-modal")
+        experts_modal = locators.modal
         await expect(experts_modal).to_be_visible()
         
-        # Get all expert rows
-        expert_rows = await page.locator(".experts-modal-table__expert").all()
-        experts = []
-        
-        for row in expert_rows:
-            try:
-                # Get expert name from the row
-                name_element = row.locator(".yearbook-block__title-link")
-                if await name_element.count() > 0:
-                    expert_name = await name_element.inner_text()
-                    
-                    # Get site name
-                    site_element = row.locator(".yearbook-block__description-text")
-                    site_name = await site_element.inner_text() if await site_element.count() > 0 else ""
-                    
-                    # Format as "Name (Site)"
-                    full_name = f"{expert_name.strip()} ({site_name.strip()})" if site_name else expert_name.strip()
-                    experts.append(full_name)
-            except Exception as e:
-                logger.debug(f"Error parsing expert row: {e}")
-                continue
+        # Read every expert row in a single in-page pass
+        experts = [name for name in await experts_modal.evaluate(EXPERT_NAMES_JS) if name]
         
         # Close modal - try multiple methods
         try:
             # Try the close button first
-            await page.click("button.experts-modal__header-close", timeout=5000)
+            await locators.close_button.click(timeout=5000)
         except:
             # If that fails, try clicking outside the modal or press Escape
             try:
@@ -296,15 +554,21 @@ class FantasyProsScraper:
     
     async def select_expert_pair(self, page: Page, expert1: str, expert2: str) -> bool:
         """Select exactly two experts in the modal"""
+        # Consecutive pairs on a page usually share their baseline; the modal then still holds the
+        # applied pair, so only the changed expert's checkbox needs toggling
+        previous = self._page_selection.get(page)
+        single_swap = previous is not None and len(set(previous) & {expert1, expert2}) == 1
+        
         try:
-            experts_modal = page.locator(".experts-modal")
+            locators = self._locators(page)
+            experts_modal = locators.modal
             
             # Check if modal is already open
             if await experts_modal.is_visible():
                 logger.debug("Experts modal already open, closing it first")
                 try:
                     # Try clicking the close button first
-                    close_button = page.locator("button.experts-modal__header-close")
+                    close_button = locators.close_button
                     if await close_button.is_visible():
                         await close_button.click()
                     else:
@@ -324,13 +588,15 @@ class FantasyProsScraper:
                         pass
             
             # Open expert selection modal
-            await page.locator("button[aria-label='Open experts modal']").click()
+            await locators.open_modal_button.click()
             await expect(experts_modal).to_be_visible()
             await page.wait_for_timeout(1000)  # Let modal fully load
             
             # Step 1: Handle "Select all experts" checkbox - uncheck it if checked
-            select_all_checkbox = page.locator("#experts-modal-select-all")
-            if await select_all_checkbox.count() > 0:
+            select_all_checkbox = locators.select_all
+            if single_swap:
+                logger.debug(f"Swapping one expert of the applied pair {previous}")
+            elif await select_all_checkbox.count() > 0:
                 is_checked = await select_all_checkbox.is_checked()
                 if is_checked:
                     logger.debug("Unchecking 'Select all experts' checkbox")
@@ -341,108 +607,14 @@ class FantasyProsScraper:
             else:
                 logger.debug("'Select all experts' checkbox not found")
             
-            # Step 2: Clear all individual expert selections (redundant safety step)
-            # Try to find and click "Clear All" button if it exists
-            try:
-                clear_button = experts_modal.get_by_role("button", name="Clear All")
-                if await clear_button.is_visible():
-                    await clear_button.click()
-                    await page.wait_for_timeout(500)
-                    logger.debug("Clicked 'Clear All' button")
-            except:
-                logger.debug("'Clear All' button not found or not clickable")
-            
-            # Step 3: Find and select the two specific experts
-            selected_count = 0
-            expert_rows = await page.locator(".experts-modal-table__expert").all()
-            logger.info(f"Found {len(expert_rows)} expert rows in modal")
-            
-            # Debug: Let's see what we're actually looking for
+            # Step 2: Check the two experts and uncheck everyone else in one in-page pass
             logger.info(f"Looking for experts: '{expert1}' and '{expert2}'")
+            checked = await experts_modal.evaluate(SELECT_EXPERTS_JS, [expert1, expert2])
+            await page.wait_for_timeout(500)  # Wait for state change
+            logger.debug(f"Checked experts after selection: {checked}")
             
-            for i, row in enumerate(expert_rows):
-                try:
-                    name_element = row.locator(".yearbook-block__title-link")
-                    if await name_element.count() > 0:
-                        row_expert_name = await name_element.inner_text()
-                        site_element = row.locator(".yearbook-block__description-text")
-                        site_name = await site_element.inner_text() if await site_element.count() > 0 else ""
-                        full_name = f"{row_expert_name.strip()} ({site_name.strip()})" if site_name else row_expert_name.strip()
-                        
-                        # Debug: Log all expert names we find
-                        if i < 10:  # Only log first 10 to avoid spam
-                            logger.debug(f"Row {i}: Found expert '{full_name}'")
-                        
-                        if full_name in [expert1, expert2]:
-                            logger.info(f"🎯 MATCH FOUND: '{full_name}' matches one of our targets")
-                            
-                            # Try multiple checkbox selectors
-                            checkbox_selectors = [
-                                "input.custom-checkbox-input[type='checkbox']",
-                                "input[type='checkbox']",
-                                ".custom-checkbox-input",
-                                "input"
-                            ]
-                            
-                            checkbox_clicked = False
-                            for selector in checkbox_selectors:
-                                try:
-                                    checkbox = row.locator(selector)
-                                    checkbox_count = await checkbox.count()
-                                    logger.debug(f"  Trying selector '{selector}': found {checkbox_count} elements")
-                                    
-                                    if checkbox_count > 0:
-                                        # Check if it's actually a checkbox
-                                        first_checkbox = checkbox.first
-                                        input_type = await first_checkbox.get_attribute("type")
-                                        input_id = await first_checkbox.get_attribute("id")
-                                        input_class = await first_checkbox.get_attribute("class")
-                                        
-                                        logger.debug(f"    Element details: type='{input_type}', id='{input_id}', class='{input_class}'")
-                                        
-                                        if input_type == "checkbox":
-                                            is_checked_before = await first_checkbox.is_checked()
-                                            logger.debug(f"    Checkbox state before click: {is_checked_before}")
-                                            
-                                            # Try clicking the checkbox
-                                            await first_checkbox.check()
-                                            await page.wait_for_timeout(500)  # Wait for state change
-                                            
-                                            is_checked_after = await first_checkbox.is_checked()
-                                            logger.debug(f"    Checkbox state after click: {is_checked_after}")
-                                            
-                                            if is_checked_after:
-                                                selected_count += 1
-                                                checkbox_clicked = True
-                                                logger.info(f"✅ Successfully selected expert: {full_name}")
-                                                break
-                                            else:
-                                                logger.warning(f"    Checkbox click didn't work for {full_name}")
-                                        else:
-                                            logger.debug(f"    Element is not a checkbox (type='{input_type}')")
-                                except Exception as e:
-                                    logger.debug(f"    Error with selector '{selector}': {e}")
-                                    continue
-                            
-                            if not checkbox_clicked:
-                                logger.error(f"❌ Failed to select expert: {full_name} - no working checkbox found")
-                                
-                                # Debug: Let's see the full HTML of this row
-                                try:
-                                    row_html = await row.inner_html()
-                                    logger.debug(f"Row HTML for {full_name}: {row_html[:500]}...")  # First 500 chars
-                                except Exception as e:
-                                    logger.debug(f"Could not get row HTML: {e}")
-                            
-                            if selected_count == 2:
-                                break
-                        
-                except Exception as e:
-                    logger.debug(f"Error processing expert row {i}: {e}")
-                    continue
-            
-            if selected_count != 2:
-                logger.error(f"Could not select both experts. Selected: {selected_count}/2")
+            if sorted(checked) != sorted([expert1, expert2]):
+                logger.error(f"Could not select both experts. Checked: {checked}")
                 logger.error(f"Looking for: {expert1}, {expert2}")
                 
                 # Take a screenshot for debugging
@@ -455,29 +627,23 @@ class FantasyProsScraper:
                 except:
                     pass
                 
-                # Close modal and return failure
+                # Close modal and return failure; the modal state is unknown now
+                self._page_selection.pop(page, None)
                 try:
-                    await page.click("button.experts-modal__header-close")
+                    await locators.close_button.click()
                 except:
                     await page.keyboard.press("Escape")
                 return False
             
-            # Step 4: Apply the selection using the correct button selector
+            # Step 3: Apply the selection using the correct button selector
             logger.debug("Applying expert selection...")
+            self._page_selection[page] = (expert1, expert2)
+            previous_table = await page.evaluate(f"() => {RANKING_TABLE_TEXT_JS}")
             
             # Try the primary Apply button first (based on your HTML)
-            apply_button_selectors = [
-                "button.fp-cta-button.fp-cta-button__primary:has-text('Apply')",
-                "button:has-text('Apply')",
-                "button.fp-cta-button:has-text('Apply')",
-                # Fallback to the old selector
-                experts_modal.get_by_role("button", name="Save My Experts")
-            ]
-            
             applied = False
-            for selector in apply_button_selectors[:-1]:  # Try CSS selectors first
+            for selector, apply_button in locators.apply_buttons:  # Try CSS selectors first
                 try:
-                    apply_button = page.locator(selector)
                     if await apply_button.count() > 0 and await apply_button.is_visible():
                         await apply_button.click()
                         applied = True
@@ -488,18 +654,25 @@ class FantasyProsScraper:
                     continue
             
             # Try the role-based selector as fallback
-            if not applied:
+            if not applied and self._active_contexts > 1:
+                logger.warning("Only 'Save My Experts' is available, which changes the selection "
+                               "of every context; finishing in a single context")
+                self._single_context_required = True
+            elif not applied:
                 try:
-                    save_button = apply_button_selectors[-1]  # The locator object
+                    save_button = locators.save_button  # Fallback to the old selector
                     if await save_button.is_visible():
                         await save_button.click()
                         applied = True
+                        # Other pages no longer show what they last applied
+                        self._page_selection = {page: (expert1, expert2)}
                         logger.debug("✅ Applied selection using 'Save My Experts' button")
                 except Exception as e:
                     logger.debug(f"Failed to click 'Save My Experts' button: {e}")
             
             if not applied:
                 logger.error("Could not find or click Apply/Save button")
+                self._page_selection.pop(page, None)
                 return False
             
             # Wait for modal to close and rankings to update
@@ -510,7 +683,7 @@ class FantasyProsScraper:
                 # If modal doesn't close automatically, force close it
                 logger.debug("Modal didn't close automatically, forcing close")
                 try:
-                    close_button = page.locator("button.experts-modal__header-close")
+                    close_button = locators.close_button
                     if await close_button.is_visible():
                         await close_button.click()
                     else:
@@ -524,105 +697,169 @@ class FantasyProsScraper:
                     except:
                         pass
             
+            # The previous pair's table stays visible until the new one renders, so wait for it to change
+            try:
+                await page.wait_for_function(f"old => ({RANKING_TABLE_TEXT_JS}) !== old",
+                                             arg=previous_table, timeout=10000)
+                self._unrefreshed_pages.discard(page)
+            except Exception:
+                logger.debug("Rankings table did not change after applying the selection")
+                self._unrefreshed_pages.add(page)
+            
             # Extra wait for page to stabilize and rankings to update
-            await page.wait_for_timeout(self.delay + 1000)
+            await page.wait_for_timeout(self._delay_ms + 1000)
             
             logger.info(f"✅ Successfully selected experts: {expert1} + {expert2}")
             return True
             
         except Exception as e:
             logger.error(f"Error selecting expert pair: {e}")
+            self._page_selection.pop(page, None)
             return False
     
-    async def scrape_consensus_rankings(self, page: Page) -> Dict[str, int]:
-        """Scrape consensus rankings from the current page"""
-        rankings = {}
+    async def scrape_consensus_rankings(self, page: Page) -> np.ndarray:
+        """Scrape consensus rankings from the current page as a vector aligned to the player index"""
+        positions, ranks = [], []
         
         # Wait for table to load
-        await expect(page.locator("#ranking-table tbody tr[data-tier='1']")).to_be_visible()
+        await expect(self._locators(page).first_tier_row).to_be_visible()
         
-        # Get all player rows
-        rows = await page.locator("#ranking-table tbody tr.player-row").all()
+        # Read rank and player attributes for every row in a single in-page pass
+        rows = await page.evaluate(
+            """() => Array.from(document.querySelectorAll('#ranking-table tbody tr.player-row')).map(r => {
+                const link = r.querySelector('a.fp-player-link');
+                return {
+                    rank: parseInt(r.querySelector('td')?.innerText, 10),
+                    id: link?.getAttribute('fp-player-id'),
+                    name: link?.getAttribute('fp-player-name'),
+                };
+            }).filter(r => !Number.isNaN(r.rank))"""
+        )
         
         for row in rows:
-            try:
-                # Get rank
-                rank_text = await row.locator("td:first-child").inner_text()
-                rank = int(rank_text.strip())
-                
-                # Get player info
-                player_link = row.locator("a.fp-player-link")
-                if await player_link.count() > 0:
-                    player_name = await player_link.get_attribute("fp-player-name")
-                    player_id = await player_link.get_attribute("fp-player-id")
-                    
-                    if player_id and player_name:
-                        rankings[player_id] = rank
-                        self.player_map[player_id] = player_name
-            except Exception as e:
-                logger.debug(f"Error parsing row: {e}")
-                continue
+            player_id, player_name = row.get("id"), row.get("name")
+            if player_id and player_name:
+                self._register_player(player_id, player_name)
+                positions.append(self._pid_index[player_id])
+                ranks.append(row["rank"])
         
-        logger.debug(f"Scraped {len(rankings)} player rankings")
+        rankings = np.full(len(self._pid_index), np.nan, dtype=np.float32)
+        rankings[positions] = ranks
+        logger.debug(f"Scraped {len(ranks)} player rankings")
         return rankings
     
-    async def get_consensus_for_pair(self, page: Page, expert1: str, expert2: str) -> Optional[Dict[str, int]]:
-        """Get consensus rankings for a specific pair of experts"""
+    async def get_consensus_for_pair(self, page: Page, expert1: str, expert2: str) -> Optional[np.ndarray]:
+        """Get consensus rankings for a specific pair of experts, None if nothing could be scraped"""
         logger.info(f"Getting consensus for: {expert1} + {expert2}")
         
+        # Resume from a previous run's checkpoint if this pair was already scraped
+        cache_file = self._pair_cache_file(expert1, expert2)
+        if cache_file.exists() and (not self.pair_cache_max_age
+                                    or time.time() - cache_file.stat().st_mtime < self.pair_cache_max_age):
+            with open(cache_file) as f:
+                cached = json.load(f)
+            for player_id, player_name in cached["players"].items():
+                self._register_player(player_id, player_name)
+            logger.info(f"Loaded cached consensus for: {expert1} + {expert2}")
+            rankings = self._to_vector(cached["rankings"])
+            self._pair_observations.append((expert1, expert2, rankings))
+            return rankings
+        
+        self._throttled_pages.discard(page)
         if not await self.select_expert_pair(page, expert1, expert2):
+            self._adjust_delay(success=False)
             return None
         
-        rankings = await self.scrape_consensus_rankings(page)
+        started = time.monotonic()
+        try:
+            rankings = await self.scrape_consensus_rankings(page)
+        except Exception:
+            self._adjust_delay(success=False)
+            raise
+        fast = time.monotonic() - started < 2
+        self._adjust_delay(success=fast and page not in self._throttled_pages
+                           and page not in self._unrefreshed_pages)
         
         if self.save_screenshots:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{expert1.replace(' ', '_')}_{expert2.replace(' ', '_')}_{timestamp}.png"
             await page.screenshot(path=self.output_dir / 'screenshots' / filename)
         
+        ranked = np.flatnonzero(~np.isnan(rankings))
+        if len(ranked) == 0:
+            return None
+        
+        self._pair_observations.append((expert1, expert2, rankings))
+        player_ids = list(self._pid_index)
+        with open(cache_file, 'w') as f:
+            json.dump({"rankings": {player_ids[i]: int(rankings[i]) for i in ranked},
+                       "players": {player_ids[i]: self.player_map[player_ids[i]] for i in ranked}}, f)
+        
         return rankings
     
+    def _pair_cache_file(self, expert1: str, expert2: str) -> Path:
+        """Checkpoint file for a pair's consensus on this rankings page (expert order doesn't matter)"""
+        key = hashlib.sha1("|".join([self.rankings_url, *sorted([expert1, expert2])]).encode()).hexdigest()
+        return self.pair_cache_dir / f"{key}.json"
+    
+    def invalidate_pair_cache(self, older_than: timedelta) -> int:
+        """Delete pair checkpoints older than the given age, returning how many were removed"""
+        cutoff = (datetime.now() - older_than).timestamp()
+        removed = 0
+        for cache_file in self.pair_cache_dir.glob("*.json"):
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+                removed += 1
+        logger.info(f"Removed {removed} pair cache entries older than {older_than.days} days")
+        return removed
+    
+    def _register_player(self, player_id: str, player_name: str) -> None:
+        """Record a player's name and give new players the next slot in the ranking vectors"""
+        self.player_map[player_id] = player_name
+        if player_id not in self._pid_index:
+            self._pid_index[player_id] = len(self._pid_index)
+    
+    def _to_vector(self, rankings: Dict[str, float]) -> np.ndarray:
+        """Dense float32 vector aligned to the player index, NaN where a player is unranked"""
+        vector = np.full(len(self._pid_index), np.nan, dtype=np.float32)
+        if rankings:
+            idx = np.fromiter((self._pid_index[pid] for pid in rankings), dtype=np.intp, count=len(rankings))
+            vector[idx] = np.fromiter(rankings.values(), dtype=np.float32, count=len(rankings))
+        return vector
+    
+    def _align(self, vector: np.ndarray) -> np.ndarray:
+        """Pad a vector with NaN for players indexed after it was built"""
+        missing = len(self._pid_index) - len(vector)
+        if missing == 0:
+            return vector
+        return np.concatenate([vector, np.full(missing, np.nan, dtype=np.float32)])
+    
     def deduce_individual_rankings(self, expert_a: str, expert_b: str, expert_c: str,
-                                 avg_ab: Dict[str, int], avg_ac: Dict[str, int], 
-                                 avg_bc: Dict[str, int]) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]:
+                                 avg_ab: np.ndarray, avg_ac: np.ndarray, 
+                                 avg_bc: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Deduce individual rankings using the algebraic method:
         rank_A = avg(A,B) + avg(A,C) - avg(B,C)
         rank_B = 2 * avg(A,B) - rank_A
         rank_C = 2 * avg(A,C) - rank_A
-        """
-        ranks_a, ranks_b, ranks_c = {}, {}, {}
         
-        # Get all player IDs that appear in all three consensus rankings
-        all_players = set(avg_ab.keys()) & set(avg_ac.keys()) & set(avg_bc.keys())
+        Players missing from any of the three consensus rankings come out as NaN.
+        """
+        ab, ac, bc = self._align(avg_ab), self._align(avg_ac), self._align(avg_bc)
         
-        for player_id in all_players:
-            # Apply the algebraic formulas
-            rank_a = avg_ab[player_id] + avg_ac[player_id] - avg_bc[player_id]
-            rank_b = 2 * avg_ab[player_id] - rank_a
-            rank_c = 2 * avg_ac[player_id] - rank_a
-            
-            ranks_a[player_id] = rank_a
-            ranks_b[player_id] = rank_b
-            ranks_c[player_id] = rank_c
+        ranks_a, ranks_b, ranks_c = deduce_triplet(ab, ac, bc)
         
-        logger.info(f"Deduced rankings for {len(all_players)} players")
+        ranked_by_all = ~(np.isnan(ab) | np.isnan(ac) | np.isnan(bc))
+        logger.info(f"Deduced rankings for {np.count_nonzero(ranked_by_all)} players")
         return ranks_a, ranks_b, ranks_c
     
-    def deduce_expert_ranking(self, baseline_ranks: Dict[str, float], 
-                            consensus_ranks: Dict[str, int]) -> Dict[str, float]:
+    def deduce_expert_ranking(self, baseline_ranks: np.ndarray, 
+                            consensus_ranks: np.ndarray) -> np.ndarray:
         """
         Deduce individual expert ranking using baseline:
         rank_X = 2 * avg(baseline, X) - rank_baseline
         """
-        target_ranks = {}
-        
-        for player_id in consensus_ranks:
-            if player_id in baseline_ranks:
-                rank_target = 2 * consensus_ranks[player_id] - baseline_ranks[player_id]
-                target_ranks[player_id] = rank_target
-        
-        return target_ranks
+        return deduce_from_baseline(self._align(consensus_ranks), self._align(baseline_ranks))
     
     async def scrape_all_experts(self, page: Page) -> None:
         """Main scraping logic to get all expert rankings"""
@@ -667,20 +904,15 @@ class FantasyProsScraper:
         expert_a, expert_b, expert_c = self.experts_list[0], self.experts_list[1], self.experts_list[2]
         
         # Get the three necessary consensus rankings
-        avg_ab = await self.get_consensus_for_pair(page, expert_a, expert_b)
-        if not avg_ab:
-            logger.error("Failed to get consensus for first pair")
-            return
-        
-        avg_ac = await self.get_consensus_for_pair(page, expert_a, expert_c)
-        if not avg_ac:
-            logger.error("Failed to get consensus for second pair")
-            return
-        
-        avg_bc = await self.get_consensus_for_pair(page, expert_b, expert_c)
-        if not avg_bc:
-            logger.error("Failed to get consensus for third pair")
-            return
+        consensus = {}
+        for pair in [(expert_a, expert_b), (expert_a, expert_c), (expert_b, expert_c)]:
+            consensus[pair] = await self.get_consensus_for_pair(page, *pair)
+            if consensus[pair] is None:
+                logger.error(f"Failed to get consensus for pair {pair[0]} + {pair[1]}")
+                return
+        avg_ab = consensus[(expert_a, expert_b)]
+        avg_ac = consensus[(expert_a, expert_c)]
+        avg_bc = consensus[(expert_b, expert_c)]
         
         # Deduce individual rankings for the baseline experts
         ranks_a, ranks_b, ranks_c = self.deduce_individual_rankings(
@@ -695,31 +927,179 @@ class FantasyProsScraper:
         
         # Part B: Deduce all other experts using the baseline
         logger.info("\n=== PART B: Deducing remaining expert rankings ===")
-        baseline_expert = expert_a
-        baseline_ranks = ranks_a
         
-        for i in range(3, len(self.experts_list)):
-            target_expert = self.experts_list[i]
-            logger.info(f"\nProcessing expert {i+1}/{len(self.experts_list)}: {target_expert}")
-            
+        # Baseline candidates, densest first (stable sort keeps expert A on ties)
+        self._baselines = sorted(
+            [(expert_a, ranks_a), (expert_b, ranks_b), (expert_c, ranks_c)],
+            key=lambda baseline: -np.count_nonzero(~np.isnan(baseline[1]))
+        )
+        logger.info(f"Using {self._baselines[0][0]} as the primary baseline")
+        
+        targets = self.experts_list[3:]
+        if not targets:
+            return
+        
+        # Spread the independent (baseline, target) pairs over several logged-in contexts
+        pages = [page]
+        worker_count = min(self.concurrent_contexts, len(targets))
+        if worker_count > 1:
+            extra_pages = await asyncio.gather(
+                *(self._open_worker_page(page.context.browser) for _ in range(worker_count - 1))
+            )
+            pages += [p for p in extra_pages if p]
+        logger.info(f"Scraping {len(targets)} experts across {len(pages)} browser context(s)")
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for i, target_expert in enumerate(targets, start=4):
+            queue.put_nowait((i, target_expert))
+        
+        deferred: List[Tuple[int, str]] = []
+        
+        async def worker(worker_page: Page) -> None:
+            try:
+                while not queue.empty() and not self._single_context_required:
+                    i, target_expert = queue.get_nowait()
+                    await self._process_target(worker_page, i, target_expert)
+                    if self._single_context_required and target_expert not in self.expert_rankings:
+                        deferred.append((i, target_expert))
+            finally:
+                self._active_contexts -= 1
+        
+        self._active_contexts = len(pages)
+        try:
+            await asyncio.gather(*(worker(p) for p in pages))
+        finally:
+            self._active_contexts = 1
+            for worker_page in pages[1:]:
+                self._page_locators.pop(worker_page, None)
+                self._page_selection.pop(worker_page, None)
+                self._unrefreshed_pages.discard(worker_page)
+                await worker_page.context.close()
+        
+        # Targets left once the account-wide "Save My Experts" path was needed
+        while not queue.empty():
+            deferred.append(queue.get_nowait())
+        if deferred:
+            logger.info(f"Finishing {len(deferred)} expert(s) in a single context")
+            for i, target_expert in sorted(deferred):
+                await self._process_target(page, i, target_expert)
+        
+        self.refine_with_least_squares()
+    
+    async def _process_target(self, page: Page, i: int, target_expert: str) -> None:
+        """Scrape one queued target, logging failures so the remaining targets still run"""
+        logger.info(f"\nProcessing expert {i}/{len(self.experts_list)}: {target_expert}")
+        try:
+            await self._scrape_target(page, target_expert)
+        except Exception as e:
+            logger.warning(f"Error scraping {target_expert}, skipping: {e}")
+    
+    async def _scrape_target(self, page: Page, target_expert: str) -> None:
+        """
+        Deduce one expert's rankings from its consensus with a baseline expert.
+        Falls back to the next baseline when too few of the target's players can be deduced.
+        """
+        best_ranks, best_count = None, -1
+        
+        for used, (baseline_expert, baseline_ranks) in enumerate(self._baselines, start=1):
             consensus = await self.get_consensus_for_pair(page, baseline_expert, target_expert)
-            if not consensus:
-                logger.warning(f"Failed to get consensus for {target_expert}, skipping")
+            if consensus is None:
                 continue
             
             target_ranks = self.deduce_expert_ranking(baseline_ranks, consensus)
-            self.expert_rankings[target_expert] = target_ranks
+            deduced = np.count_nonzero(~np.isnan(target_ranks))
+            if deduced > best_count:
+                best_ranks, best_count = target_ranks, deduced
             
-            logger.info(f"Successfully deduced rankings for {target_expert}")
+            ranked = np.count_nonzero(~np.isnan(consensus))
+            if deduced >= self.min_baseline_coverage * ranked:
+                break
+            logger.info(f"Only {deduced}/{ranked} players deduced via {baseline_expert}, "
+                        "trying next baseline")
+        
+        if best_ranks is None:
+            logger.warning(f"Failed to get consensus for {target_expert}, skipping")
+            return
+        
+        self.expert_rankings[target_expert] = best_ranks
+        logger.info(f"Successfully deduced rankings for {target_expert}")
+        
+        # Redundant observations against further baselines, used by refine_with_least_squares
+        for baseline_expert, _ in self._baselines[used:used + self.extra_baseline_pairs]:
+            await self.get_consensus_for_pair(page, baseline_expert, target_expert)
+    
+    def refine_with_least_squares(self) -> None:
+        """
+        Re-estimate every expert's ranks from all observed pairs at once.
+        Each pair (i, j) with consensus y gives r_i + r_j = 2y; when more pairs were scraped
+        than there are experts, the least-squares solution averages out the rounding in
+        individual consensus ranks instead of propagating it through a single baseline.
+        """
+        experts = list(self.expert_rankings)
+        column = {expert: k for k, expert in enumerate(experts)}
+        observations = [(e1, e2, ranks) for e1, e2, ranks in self._pair_observations
+                        if e1 in column and e2 in column]
+        if len(observations) <= len(experts):
+            return  # exactly determined - the direct deduction is already the solution
+        
+        A = np.zeros((len(observations), len(experts)))
+        for row, (expert1, expert2, _) in enumerate(observations):
+            A[row, column[expert1]] = A[row, column[expert2]] = 1
+        B = 2 * np.stack([self._align(ranks) for _, _, ranks in observations])
+        
+        # Players observed in the same set of pairs share one multi-right-hand-side solve
+        observed = ~np.isnan(B)
+        patterns, inverse = np.unique(observed.T, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        solved = np.full((len(experts), B.shape[1]), np.nan, dtype=np.float32)
+        
+        for p, pattern in enumerate(patterns):
+            A_sub = A[pattern]
+            cols = np.flatnonzero(A_sub.any(axis=0))
+            if len(cols) == 0 or np.linalg.matrix_rank(A_sub[:, cols]) < len(cols):
+                continue  # these observations don't pin down every expert involved
+            players = np.flatnonzero(inverse == p)
+            X, *_ = np.linalg.lstsq(A_sub[:, cols], B[np.ix_(pattern, players)], rcond=None)
+            solved[np.ix_(cols, players)] = X
+        
+        for k, expert in enumerate(experts):
+            current = self._align(self.expert_rankings[expert])
+            self.expert_rankings[expert] = np.where(np.isnan(solved[k]), current, solved[k])
+        
+        logger.info(f"Refined rankings with least squares over {len(observations)} pairs "
+                    f"for {len(experts)} experts")
+    
+    async def _open_worker_page(self, browser: Browser) -> Optional[Page]:
+        """Open an extra logged-in page on its own context for concurrent pair scraping"""
+        context = await self._new_context(browser)
+        page = await context.new_page()
+        self._watch_responses(page)
+        try:
+            await page.goto(self.base_url, wait_until="domcontentloaded", timeout=self.timeout)
+            await self.handle_cookie_consent(page)
+            if await self._ensure_logged_in(page):
+                return page
+        except Exception as e:
+            logger.warning(f"Could not prepare worker context: {e}")
+        
+        await context.close()
+        return None
     
-    def save_results(self) -> None:
+    async def save_results(self) -> None:
         """Save scraped data in multiple formats"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Save raw deduced rankings as JSON
+        pids = list(self._pid_index)
+        raw_rankings = {}
+        for expert_name, ranks in self.expert_rankings.items():
+            ranks = self._align(ranks)
+            ranked = np.flatnonzero(~np.isnan(ranks))
+            raw_rankings[expert_name] = {pids[i]: float(ranks[i]) for i in ranked}
+        
         raw_data_file = self.output_dir / f"deduced_rankings_{timestamp}.json"
         with open(raw_data_file, 'w') as f:
-            json.dump(self.expert_rankings, f, indent=2)
+            json.dump(raw_rankings, f, indent=2)
         logger.info(f"Saved raw rankings to {raw_data_file}")
         
         # Save player mapping
@@ -728,40 +1108,67 @@ class FantasyProsScraper:
             json.dump(self.player_map, f, indent=2)
         logger.info(f"Saved player map to {player_map_file}")
         
-        # Create DataFrame for analysis
-        df_data = []
-        for player_id, player_name in self.player_map.items():
-            row = {
-                "Player ID": player_id,
-                "Player": player_name
-            }
-            
-            # Add each expert's ranking
-            for expert_name in self.experts_list:
-                if expert_name in self.expert_rankings:
-                    row[expert_name] = self.expert_rankings[expert_name].get(player_id, None)
-            
-            df_data.append(row)
+        # Build the players x experts matrix from the aligned per-expert vectors
+        experts = [e for e in self.experts_list if e in self.expert_rankings]
+        arr = np.stack([self._align(self.expert_rankings[e]) for e in experts], axis=1)
         
-        df = pd.DataFrame(df_data)
+        # Calculate count, average rank and sample standard deviation from one pass of sums
+        valid = ~np.isnan(arr)
+        filled = np.where(valid, arr, 0).astype(np.float64)
+        count = valid.sum(axis=1)
+        total = filled.sum(axis=1)
+        total_sq = np.einsum('ij,ij->i', filled, filled)
+        with np.errstate(invalid='ignore', divide='ignore'):  # rows ranked by fewer than 2 experts
+            avg = total / count
+            var = (total_sq - count * avg ** 2) / (count - 1)
+        std = np.where(count > 1, np.sqrt(np.maximum(var, 0)), np.nan)
         
-        # Calculate average rank and standard deviation
-        expert_columns = [col for col in df.columns if col not in ["Player ID", "Player"]]
-        df["Average Rank"] = df[expert_columns].mean(axis=1, skipna=True)
-        df["Std Dev"] = df[expert_columns].std(axis=1, skipna=True)
-        df["Expert Count"] = df[expert_columns].count(axis=1)
+        # Sort by average rank, partitioning out just the top N first when TOP_N is set
+        if 0 < self.top_n < len(avg):
+            order = np.argpartition(avg, self.top_n)[:self.top_n]
+            order = order[np.argsort(avg[order], kind="stable")]
+        else:
+            order = np.argsort(avg, kind="stable")
+        player_ids = np.asarray(pids)[order]
+        table = pa.table({
+            "Player ID": player_ids,
+            "Player": [self.player_map[pid] for pid in player_ids],
+            **{expert: arr[order, i] for i, expert in enumerate(experts)},
+            "Average Rank": avg[order],
+            "Std Dev": std[order],
+            "Expert Count": count[order],
+        })
+        
+        # Save as Parquet (columnar, compressed - the primary output for analysis)
+        parquet_file = self.output_dir / f"expert_rankings_{timestamp}.parquet"
+        pq.write_table(table, parquet_file, compression='zstd')
+        logger.info(f"Saved rankings Parquet to {parquet_file}")
         
-        # Sort by average rank
-        df = df.sort_values("Average Rank")
+        if self.write_csv or self.write_xlsx:
+            df = table.to_pandas()
         
         # Save as CSV
-        csv_file = self.output_dir / f"expert_rankings_{timestamp}.csv"
-        df.to_csv(csv_file, index=False)
-        logger.info(f"Saved rankings CSV to {csv_file}")
+        if self.write_csv:
+            csv_file = self.output_dir / f"expert_rankings_{timestamp}.csv"
+            df.to_csv(csv_file, index=False)
+            logger.info(f"Saved rankings CSV to {csv_file}")
+        
+        # Save as Excel (off the event loop - it's the slowest of the writers)
+        if self.write_xlsx:
+            excel_file = self.output_dir / f"expert_rankings_{timestamp}.xlsx"
+            await asyncio.to_thread(self._write_xlsx, df, excel_file)
+            logger.info(f"Saved rankings Excel to {excel_file}")
         
-        # Save as Excel with formatting
-        excel_file = self.output_dir / f"expert_rankings_{timestamp}.xlsx"
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+        # Print summary statistics
+        logger.info("\n=== SCRAPING SUMMARY ===")
+        logger.info(f"Total experts scraped: {len(self.expert_rankings)}")
+        logger.info(f"Total players tracked: {len(self.player_map)}")
+        logger.info(f"Average rankings per player: {count.mean():.1f}")
+    
+    def _write_xlsx(self, df: pd.DataFrame, excel_file: Path) -> None:
+        """Write the rankings and a summary sheet with the streaming xlsxwriter engine"""
+        with pd.ExcelWriter(excel_file, engine='xlsxwriter') as writer:
+            writer.book.use_zip64()
             df.to_excel(writer, sheet_name='Rankings', index=False)
             
             # Add a summary sheet
@@ -772,14 +1179,6 @@ class FantasyProsScraper:
             }
             summary_df = pd.DataFrame(summary_data)
             summary_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        logger.info(f"Saved rankings Excel to {excel_file}")
-        
-        # Print summary statistics
-        logger.info("\n=== SCRAPING SUMMARY ===")
-        logger.info(f"Total experts scraped: {len(self.expert_rankings)}")
-        logger.info(f"Total players tracked: {len(self.player_map)}")
-        logger.info(f"Average rankings per player: {df['Expert Count'].mean():.1f}")
     
     async def run(self) -> None:
         """Main execution method"""
@@ -788,9 +1187,10 @@ class FantasyProsScraper:
         
         async with async_playwright() as p:
             logger.info("Launching browser...")
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context()
+            browser = await p.chromium.launch(headless=self.headless, args=CHROMIUM_ARGS)
+            context = await self._new_context(browser)
             page = await context.new_page()
+            self._watch_responses(page)
             
             try:
                 # Handle cookie consent first (on any page)
@@ -799,22 +1199,12 @@ class FantasyProsScraper:
                 
                 # Login is required for Pick Experts feature
                 logger.info("Logging in to FantasyPros...")
-                if not await self.login(page):
+                if not await self._ensure_logged_in(page):
                     logger.error("Login failed, cannot proceed")
                     return
                 
-                # Wait for page to fully load - use domcontentloaded instead of networkidle
-                # (networkidle can timeout on pages with ongoing background requests)
-                try:
-                    await page.wait_for_load_state("networkidle", timeout=15000)
-                except Exception as e:
-                    logger.warning(f"Networkidle timeout (normal for dynamic pages): {e}")
-                    logger.info("Continuing with domcontentloaded state...")
-                
-                await page.wait_for_timeout(3000)  # Give extra time for dynamic content
-                
                 # Verify we can access the Pick Experts feature
-                pick_experts_button = page.locator("button[aria-label='Open experts modal']")
+                pick_experts_button = self._locators(page).open_modal_button
                 if await pick_experts_button.count() == 0:
                     logger.error("Pick Experts button not found - login may have failed or feature unavailable")
                     
@@ -836,7 +1226,7 @@ class FantasyProsScraper:
                 
                 # Save results
                 if self.expert_rankings:
-                    self.save_results()
+                    await self.save_results()
                 else:
                     logger.warning("No rankings were scraped")
                 
@@ -856,11 +1246,20 @@ class FantasyProsScraper:
             finally:
                 await browser.close()
                 logger.info("Browser closed")
+                if self.network_cache:
+                    logger.info(f"Network cache: {self.network_cache.hits} hits, {self.network_cache.misses} misses")
 
 
 async def main():
     """Entry point"""
+    parser = argparse.ArgumentParser(description="Scrape individual FantasyPros expert rankings")
+    parser.add_argument("--invalidate-older-than", type=int, metavar="DAYS",
+                        help="Discard cached pair consensus scraped more than DAYS days ago")
+    args = parser.parse_args()
+    
     scraper = FantasyProsScraper()
+    if args.invalidate_older_than is not None:
+        scraper.invalidate_pair_cache(timedelta(days=args.invalidate_older_than))
     await scraper.run()
 
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Numeric kernels for the ranking deduction math
+JIT-compiled with Numba for very large player pools when it is installed, plain NumPy otherwise
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Below this many players NumPy wins: the JIT's compile/cache load and thread start-up
+# cost far more than the few vectorized operations it replaces
+JIT_MIN_PLAYERS = 50_000
+
+
+if HAVE_NUMBA:
+    # No fastmath: NaN marks unranked players and must propagate through the math
+    @njit(parallel=True, cache=True)
+    def _deduce_triplet(ab, ac, bc, out_a, out_b, out_c):
+        for i in prange(ab.shape[0]):
+            a = ab[i] + ac[i] - bc[i]
+            out_a[i] = a
+            out_b[i] = 2 * ab[i] - a
+            out_c[i] = 2 * ac[i] - a
+
+    @njit(parallel=True, cache=True)
+    def _deduce_from_baseline(consensus, baseline, out):
+        for i in prange(consensus.shape[0]):
+            out[i] = 2 * consensus[i] - baseline[i]
+
+
+def deduce_triplet(ab: np.ndarray, ac: np.ndarray, bc: np.ndarray):
+    """
+    Individual ranks of A, B and C from their three pairwise consensus vectors:
+    rank_A = avg(A,B) + avg(A,C) - avg(B,C)
+    rank_B = 2 * avg(A,B) - rank_A
+    rank_C = 2 * avg(A,C) - rank_A
+    """
+    if not HAVE_NUMBA or ab.shape[0] <= JIT_MIN_PLAYERS:
+        rank_a = ab + ac - bc
+        return rank_a, 2 * ab - rank_a, 2 * ac - rank_a
+
+    out_a, out_b, out_c = np.empty_like(ab), np.empty_like(ab), np.empty_like(ab)
+    _deduce_triplet(ab, ac, bc, out_a, out_b, out_c)
+    return out_a, out_b, out_c
+
+
+def deduce_from_baseline(consensus: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Rank of X from avg(baseline, X) and the baseline's own ranks: 2 * avg - baseline"""
+    if not HAVE_NUMBA or consensus.shape[0] <= JIT_MIN_PLAYERS:
+        return 2 * consensus - baseline
+
+    out = np.empty_like(consensus)
+    _deduce_from_baseline(consensus, baseline, out)
+    return out
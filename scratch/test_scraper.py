@@ -4,12 +4,17 @@ Test script for FantasyPros Scraper
 Verifies setup and basic functionality
 """
 
+import argparse
 import asyncio
+import importlib.util
+import logging
 import os
 import sys
+from contextvars import ContextVar
 from pathlib import Path
-from playwright.async_api import async_playwright
-from dotenv import load_dotenv
+from typing import List, Optional, Tuple
+from playwright.async_api import Browser, BrowserContext, Route, async_playwright
+from dotenv import dotenv_values
 import colorlog
 
 # Setup logging
@@ -22,6 +27,29 @@ logger = colorlog.getLogger(__name__)
 logger.addHandler(handler)
 logger.setLevel('INFO')
 
+# Set inside a concurrently running test to collect its log records instead of printing them
+_log_buffer: ContextVar[Optional[List[logging.LogRecord]]] = ContextVar('log_buffer', default=None)
+
+
+class BufferingFilter(logging.Filter):
+    """Divert records into the current task's buffer when one is set"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = _log_buffer.get()
+        if buffer is None:
+            return True
+        buffer.append(record)
+        return False
+
+
+handler.addFilter(BufferingFilter())
+
+RANKINGS_URL = "https://www.fantasypros.com/nfl/rankings/half-point-ppr-cheatsheets.php"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# .env parsed once into a plain dict; real environment variables win, as with load_dotenv()
+ENV = {**dotenv_values('.env'), **os.environ}
+
 
 def test_environment():
     """Test environment setup"""
@@ -32,12 +60,9 @@ def test_environment():
         logger.error(".env file not found. Run python setup.py first")
         return False
     
-    # Load environment variables
-    load_dotenv()
-    
     # Check required variables
-    email = os.getenv('FANTASYPROS_EMAIL')
-    password = os.getenv('FANTASYPROS_PASSWORD')
+    email = ENV.get('FANTASYPROS_EMAIL')
+    password = ENV.get('FANTASYPROS_PASSWORD')
     
     if not email or email == 'your_email@example.com':
         logger.error("FANTASYPROS_EMAIL not configured in .env")
@@ -55,75 +80,108 @@ def test_imports():
     """Test all required imports"""
     logger.info("Testing imports...")
     
-    try:
-        import pandas
-        import numpy
-        import playwright
-        import dotenv
-        import colorlog
-        import openpyxl
-        logger.info("✅ All required packages imported successfully")
-        return True
-    except ImportError as e:
-        logger.error(f"Import error: {e}")
+    # find_spec only locates each package - no need to pay for actually importing it
+    packages = ['pandas', 'numpy', 'pyarrow', 'playwright', 'dotenv', 'colorlog', 'xlsxwriter', 'httpx']
+    missing = [name for name in packages if importlib.util.find_spec(name) is None]
+    
+    if missing:
+        logger.error(f"Missing packages: {', '.join(missing)}")
         logger.error("Run: pip install -r requirements.txt")
         return False
+    
+    logger.info("✅ All required packages are installed")
+    return True
 
 
-async def test_playwright():
+async def test_playwright(browser: Optional[Browser], fp_context: Optional[BrowserContext]):
     """Test Playwright browser launch"""
     logger.info("Testing Playwright browser launch...")
     
+    if browser is None:
+        logger.error("Run: playwright install chromium")
+        return False
+    
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto("https://www.google.com")
-            title = await page.title()
-            await browser.close()
-            
-            if "Google" in title:
-                logger.info("✅ Playwright browser test successful")
-                return True
-            else:
-                logger.error("Unexpected page title")
-                return False
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            # Chromium itself is under test - a blank page needs no network
+            await page.goto("about:blank")
+            user_agent = await page.evaluate("() => navigator.userAgent")
+        finally:
+            await context.close()
+        
+        if "Chrome" in user_agent:
+            logger.info("✅ Playwright browser test successful")
+            return True
+        else:
+            logger.error(f"Unexpected user agent: {user_agent}")
+            return False
     except Exception as e:
         logger.error(f"Playwright test failed: {e}")
         logger.error("Run: playwright install chromium")
         return False
 
 
-async def test_fantasypros_access():
-    """Test access to FantasyPros website"""
+async def test_fantasypros_access(browser: Optional[Browser], fp_context: Optional[BrowserContext]):
+    """Test access to FantasyPros website with a plain HTTP request (no page render)"""
     logger.info("Testing FantasyPros website access...")
     
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            # Set a realistic user agent
-            await page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            
+        import httpx  # Imported here so a missing httpx fails this check, not the whole script
+        async with httpx.AsyncClient(timeout=15, headers={'User-Agent': USER_AGENT},
+                                     follow_redirects=True) as client:
+            response = await client.head(RANKINGS_URL)
+            if response.status_code == 405:  # HEAD not allowed - fall back to GET, headers only
+                async with client.stream("GET", RANKINGS_URL) as response:
+                    pass
+        
+        if response.status_code == 200:
+            logger.info("✅ FantasyPros website accessible")
+            return True
+        else:
+            logger.error(f"Failed to access FantasyPros. Status: {response.status_code}")
+            return False
+    except Exception as e:
+        logger.error(f"FantasyPros access test failed: {e}")
+        return False
+
+
+async def block_subresources(route: Route) -> None:
+    """Abort images, fonts, media and stylesheets - the page load check doesn't need them"""
+    if route.request.resource_type in ('image', 'font', 'media', 'stylesheet'):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def test_fantasypros_render(browser: Optional[Browser], fp_context: Optional[BrowserContext]):
+    """Test loading the FantasyPros rankings page in the browser (--deep)"""
+    logger.info("Testing FantasyPros page load in the browser...")
+    
+    if fp_context is None:
+        logger.error("No browser available for the page load test")
+        return False
+    
+    try:
+        page = await fp_context.new_page()
+        try:
             response = await page.goto(
-                "https://www.fantasypros.com/nfl/rankings/half-point-ppr-cheatsheets.php",
+                RANKINGS_URL,
                 wait_until="domcontentloaded",
                 timeout=30000
             )
-            
-            await browser.close()
-            
-            if response and response.status == 200:
-                logger.info("✅ FantasyPros website accessible")
-                return True
-            else:
-                logger.error(f"Failed to access FantasyPros. Status: {response.status if response else 'No response'}")
-                return False
+        finally:
+            await page.close()
+        
+        if response and response.status == 200:
+            logger.info("✅ FantasyPros page loads in the browser")
+            return True
+        else:
+            logger.error(f"Failed to load FantasyPros. Status: {response.status if response else 'No response'}")
+            return False
     except Exception as e:
-        logger.error(f"FantasyPros access test failed: {e}")
+        logger.error(f"FantasyPros page load test failed: {e}")
         return False
 
 
@@ -132,10 +190,9 @@ def test_output_directory():
     logger.info("Testing output directory...")
     
     output_dir = Path("output")
-    if not output_dir.exists():
-        output_dir.mkdir()
+    output_dir.mkdir(parents=True, exist_ok=True)
     
-    if output_dir.exists() and output_dir.is_dir():
+    if output_dir.is_dir():
         logger.info("✅ Output directory ready")
         return True
     else:
@@ -143,8 +200,21 @@ def test_output_directory():
         return False
 
 
-async def run_tests():
-    """Run all tests"""
+async def run_buffered(test_func, browser: Optional[Browser],
+                       fp_context: Optional[BrowserContext]) -> Tuple[bool, List[logging.LogRecord]]:
+    """Run an async test, holding back its log records so concurrent tests don't interleave"""
+    records: List[logging.LogRecord] = []
+    _log_buffer.set(records)  # gather runs each test in its own task, so this stays local to it
+    try:
+        result = await test_func(browser, fp_context)
+    except Exception as e:
+        logger.error(f"Test crashed: {e}")
+        result = False
+    return result, records
+
+
+async def run_tests(deep: bool = False):
+    """Run all tests; deep adds a full browser page load of FantasyPros"""
     print("🧪 FantasyPros Scraper Test Suite")
     print("=" * 40)
     
@@ -155,25 +225,58 @@ async def run_tests():
         ("Playwright Browser", test_playwright),
         ("FantasyPros Access", test_fantasypros_access),
     ]
+    if deep:
+        tests.append(("FantasyPros Page Load", test_fantasypros_render))
     
-    passed = 0
-    failed = 0
+    sync_tests = [(name, func) for name, func in tests if not asyncio.iscoroutinefunction(func)]
+    async_tests = [(name, func) for name, func in tests if asyncio.iscoroutinefunction(func)]
+    results = []
     
-    for test_name, test_func in tests:
+    for test_name, test_func in sync_tests:
         print(f"\n{test_name}:")
         try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-            
-            if result:
-                passed += 1
-            else:
-                failed += 1
+            results.append(test_func())
         except Exception as e:
             logger.error(f"Test crashed: {e}")
-            failed += 1
+            results.append(False)
+    
+    async with async_playwright() as p:
+        # One Chromium process shared by the browser tests; a launch failure is reported
+        # under the Playwright test's heading rather than wherever the output happens to be
+        launch_records: List[logging.LogRecord] = []
+        token = _log_buffer.set(launch_records)
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as e:
+            logger.error(f"Browser launch failed: {e}")
+            browser = None
+        finally:
+            _log_buffer.reset(token)
+        
+        try:
+            # One context for every FantasyPros page (--deep only), so pages reuse its pooled connections
+            fp_context = None
+            if browser and deep:
+                fp_context = await browser.new_context(user_agent=USER_AGENT)
+                await fp_context.route("**/*", block_subresources)
+            
+            # The I/O-bound tests run concurrently
+            outcomes = await asyncio.gather(*(run_buffered(func, browser, fp_context) for _, func in async_tests))
+        finally:
+            if browser:
+                await browser.close()
+    
+    # Replay each async test's held-back log lines under its own heading
+    for (test_name, func), (result, records) in zip(async_tests, outcomes):
+        print(f"\n{test_name}:")
+        if func is test_playwright:  # Launch errors go right after its "Testing..." line
+            records = records[:1] + launch_records + records[1:]
+        for record in records:
+            handler.handle(record)
+        results.append(result)
+    
+    passed = sum(1 for result in results if result)
+    failed = len(results) - passed
     
     print("\n" + "=" * 40)
     print(f"Tests Passed: {passed}/{len(tests)}")
@@ -190,7 +293,12 @@ async def run_tests():
 
 def main():
     """Main entry point"""
-    success = asyncio.run(run_tests())
+    parser = argparse.ArgumentParser(description="Verify the FantasyPros scraper setup")
+    parser.add_argument("--deep", action="store_true",
+                        help="Also load the FantasyPros rankings page in Chromium")
+    args = parser.parse_args()
+    
+    success = asyncio.run(run_tests(deep=args.deep))
     sys.exit(0 if success else 1)
 
 